@@ -1,10 +1,73 @@
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
+from array import array
+import builtins
+import heapq
+import io
 import json
 import os
+import stat
+import sys
 from datetime import datetime
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Scores are stored one JSON object per line so a finished game appends a
+# single line; the old single-array file is migrated on first load
+HIGH_SCORES_FILE = "high_scores.ndjson"
+LEGACY_HIGH_SCORES_FILE = "high_scores.json"
+HIGH_SCORES_SHOWN = 50  # Maximum rows listed by show_high_scores
+
+# Banner strings reused on every node and turn
+_SEP50 = "=" * 50
+_SEP25 = "=" * 25
+_OPT1_HDR = _SEP25 + " Option 1 " + _SEP25
+_OPT2_HDR = _SEP25 + " Option 2 " + _SEP25
+
+# Range of a signed 64-bit C integer, the storage type of _compile's score arrays
+_SCORE_MIN = -(2 ** 63)
+_SCORE_MAX = 2 ** 63 - 1
+
+# Maps a player's menu choice to the option slot it selects
+_CHOICES = {"1": 0, "2": 1}
+
+# Last parsed high score list keyed on (path, st_mtime_ns) so reloading an
+# unchanged file skips disk reads and JSON parsing; holds at most one entry
+_HS_CACHE: Dict[Tuple[str, int], List] = {}
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles any int
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes):
+    """Parse UTF-8 JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _read_score(prompt: str) -> int:
+    """Prompt until the user enters a whole number that fits a score slot"""
+    while True:
+        try:
+            score = int(input(prompt))
+        except ValueError:
+            print("Please enter a whole number.")
+            continue
+        if _SCORE_MIN <= score <= _SCORE_MAX:
+            return score
+        print(f"Score must be between {_SCORE_MIN} and {_SCORE_MAX}.")
+
+@dataclass(slots=True)
 class Node:
     """Represents a story node in the adventure game"""
     story_text: str
@@ -18,64 +81,115 @@ class Node:
 class AdventureGame:
     def __init__(self):
         self.root: Optional[Node] = None
+        # Flattened copy of the story tree built by _compile(); node i's
+        # children are at _c1[i]/_c2[i], or -1 for an ending. Scores and
+        # child indices are packed C ints rather than lists of Python ints.
+        self._story: List[str] = []
+        self._t1: List[str] = []
+        self._t2: List[str] = []
+        self._s1 = array('q')
+        self._s2 = array('q')
+        self._c1 = array('i')
+        self._c2 = array('i')
         self.high_scores: List[Dict] = []
+        self._dirty = False  # True when high_scores has unsaved changes
         self.load_high_scores()
 
     def create_game(self):
         """Create a new adventure game story"""
         print("\nLet's create your adventure game!")
         print("Start with the initial scenario:")
-        initial_text = input("Enter the starting scenario: ")
+        initial_text = sys.intern(input("Enter the starting scenario: "))
         self.root = Node(initial_text)
-        self._create_node(self.root, "initial scenario")
+        self._build_tree(self.root)
+        self._compile()
         print("\nGame creation completed!")
 
-    def _create_node(self, current_node: Node, parent_choice: str):
-        """Recursively create nodes for the game"""
-        if not current_node:
-            return
-
-        print("\n" + "="*50)
-        print("CURRENT CONTEXT:")
-        print(f"Parent scenario: {current_node.story_text}")
-
-        # Ask if this is an ending
-        if input("\nIs this an ending? (y/n): ").lower() == 'y':
-            return
+    def _compile(self):
+        """Flatten the story tree into parallel arrays indexed by node"""
+        # Number nodes in depth-first order; the root is always index 0
+        order: List[Node] = []
+        index: Dict[int, int] = {}
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            index[id(node)] = len(order)
+            order.append(node)
+            if node.option2:
+                stack.append(node.option2)
+            if node.option1:
+                stack.append(node.option1)
+
+        self._story, self._t1, self._t2 = [], [], []
+        self._s1, self._s2 = array('q'), array('q')
+        self._c1, self._c2 = array('i'), array('i')
+        for node in order:
+            self._story.append(node.story_text)
+            self._t1.append(node.option1_text)
+            self._t2.append(node.option2_text)
+            self._s1.append(node.option1_score)
+            self._s2.append(node.option2_score)
+            self._c1.append(index[id(node.option1)] if node.option1 else -1)
+            self._c2.append(index[id(node.option2)] if node.option2 else -1)
+
+    def _build_tree(self, root: Node):
+        """Create nodes for the game depth-first using an explicit stack"""
+        # Each entry is (node, option label, choice text that led to it);
+        # the root has no parent choice to recap.
+        _print, _input, _write, _intern = print, input, sys.stdout.write, sys.intern
+        stack = [(root, None, None)]
+        while stack:
+            current_node, label, parent_choice = stack.pop()
+
+            buf = []
+            if label is not None:
+                buf += [
+                    "\n", _SEP50, "\n",
+                    f"Let's continue the story for {label}...\n",
+                    f"Remember, {label} was: {parent_choice}\n",
+                    f"And this led to: {current_node.story_text}\n",
+                ]
+            buf += [
+                "\n", _SEP50, "\n",
+                "CURRENT CONTEXT:\n",
+                f"Parent scenario: {current_node.story_text}\n",
+            ]
+            _write("".join(buf))
+
+            # Ask if this is an ending
+            if _input("\nIs this an ending? (y/n): ").lower() == 'y':
+                continue
 
-        # Get options for current node
-        print("\n" + "="*25 + " Option 1 " + "="*25)
-        print("Creating Option 1 for the scenario:")
-        print(f"→ {current_node.story_text}")
-        print("\nWhat choice will the player see?")
-        current_node.option1_text = input("Option 1 choice text: ")
-        current_node.option1_score = int(input("Score for choosing Option 1: "))
-        print("\nWhat happens when they choose this option?")
-        option1_result = input("Enter the story text that follows Option 1: ")
-        current_node.option1 = Node(option1_result)
-
-        print("\n" + "="*25 + " Option 2 " + "="*25)
-        print("Creating Option 2 for the scenario:")
-        print(f"→ {current_node.story_text}")
-        print("\nWhat choice will the player see?")
-        current_node.option2_text = input("Option 2 choice text: ")
-        current_node.option2_score = int(input("Score for choosing Option 2: "))
-        print("\nWhat happens when they choose this option?")
-        option2_result = input("Enter the story text that follows Option 2: ")
-        current_node.option2 = Node(option2_result)
-
-        # Recursively create next scenarios
-        print("\n" + "="*50)
-        print("Let's continue the story for Option 1...")
-        print(f"Remember, Option 1 was: {current_node.option1_text}")
-        print(f"And this led to: {option1_result}")
-        self._create_node(current_node.option1, current_node.option1_text)
-
-        print("\n" + "="*50)
-        print("Let's continue the story for Option 2...")
-        print(f"Remember, Option 2 was: {current_node.option2_text}")
-        print(f"And this led to: {option2_result}")
-        self._create_node(current_node.option2, current_node.option2_text)
+            # Get options for current node
+            _write("".join([
+                "\n", _OPT1_HDR, "\n",
+                "Creating Option 1 for the scenario:\n",
+                f"→ {current_node.story_text}\n",
+                "\nWhat choice will the player see?\n",
+            ]))
+            current_node.option1_text = _intern(_input("Option 1 choice text: "))
+            current_node.option1_score = _read_score("Score for choosing Option 1: ")
+            _print("\nWhat happens when they choose this option?")
+            option1_result = _intern(
+                _input("Enter the story text that follows Option 1: "))
+            current_node.option1 = Node(option1_result)
+
+            _write("".join([
+                "\n", _OPT2_HDR, "\n",
+                "Creating Option 2 for the scenario:\n",
+                f"→ {current_node.story_text}\n",
+                "\nWhat choice will the player see?\n",
+            ]))
+            current_node.option2_text = _intern(_input("Option 2 choice text: "))
+            current_node.option2_score = _read_score("Score for choosing Option 2: ")
+            _print("\nWhat happens when they choose this option?")
+            option2_result = _intern(
+                _input("Enter the story text that follows Option 2: "))
+            current_node.option2 = Node(option2_result)
+
+            # Push Option 2 first so Option 1's subtree is built first
+            stack.append((current_node.option2, "Option 2", current_node.option2_text))
+            stack.append((current_node.option1, "Option 1", current_node.option1_text))
 
     def play_game(self):
         """Play the created adventure game"""
@@ -83,132 +197,248 @@ class AdventureGame:
             print("\nNo game has been created yet!")
             return
 
-        print("\nWelcome to the Adventure Game!")
-        player_name = input("Please enter your name: ")
+        _print, _input = print, input
+        story = self._story
+        texts = (self._t1, self._t2)
+        scores = (self._s1, self._s2)
+        children = (self._c1, self._c2)
+
+        _print("\nWelcome to the Adventure Game!")
+        player_name = _input("Please enter your name: ")
         while not player_name.strip():
-            player_name = input("Name cannot be empty. Please enter your name: ")
+            player_name = _input("Name cannot be empty. Please enter your name: ")
 
-        current_node = self.root
+        idx = 0
         total_score = 0
-        choices_made = []
+        step = 0
+        journey = io.StringIO()
 
-        while current_node:
-            print("\n" + "="*50)
-            print(current_node.story_text)
+        while True:
+            _print("\n" + _SEP50)
+            _print(story[idx])
 
-            if not current_node.option1 and not current_node.option2:
-                print("\nThe End!")
+            if children[0][idx] == -1:
+                _print("\nThe End!")
                 break
 
-            print("\nYour options:")
-            print(f"1: {current_node.option1_text}")
-            print(f"2: {current_node.option2_text}")
+            _print("\nYour options:")
+            _print(f"1: {texts[0][idx]}")
+            _print(f"2: {texts[1][idx]}")
 
-            choice = input("\nEnter your choice (1/2): ")
+            choice = _input("\nEnter your choice (1/2): ")
 
-            if choice == "1":
-                total_score += current_node.option1_score
-                choices_made.append({
-                    "choice": current_node.option1_text,
-                    "outcome": current_node.option1.story_text
-                })
-                current_node = current_node.option1
-            elif choice == "2":
-                total_score += current_node.option2_score
-                choices_made.append({
-                    "choice": current_node.option2_text,
-                    "outcome": current_node.option2.story_text
-                })
-                current_node = current_node.option2
-            else:
-                print("Invalid choice! Please choose 1 or 2")
+            slot = _CHOICES.get(choice)
+            if slot is None:
+                _print("Invalid choice! Please choose 1 or 2")
                 continue
 
-        print(f"\nGame Over, {player_name}!")
-        print(f"Your total score: {total_score}")
-        print("\nYour journey:")
-        for i, choice in enumerate(choices_made, 1):
-            print(f"\nStep {i}:")
-            print(f"You chose: {choice['choice']}")
-            print(f"Result: {choice['outcome']}")
+            text = texts[slot][idx]
+            total_score += scores[slot][idx]
+            idx = children[slot][idx]
+            step += 1
+            journey.write(
+                f"\nStep {step}:\nYou chose: {text}\nResult: {story[idx]}\n"
+            )
+
+        sys.stdout.write("".join([
+            f"\nGame Over, {player_name}!\n",
+            f"Your total score: {total_score}\n",
+            "\nYour journey:\n",
+            journey.getvalue(),
+        ]))
 
         # Save score with player name and timestamp
         score_entry = {
             "player_name": player_name,
             "score": total_score,
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "date": datetime.now().isoformat(sep=" ", timespec="seconds")
         }
         self.high_scores.append(score_entry)
-        self.save_high_scores()
+        self._append_score(score_entry)
 
     def show_high_scores(self):
-        """Display all high scores"""
+        """Display the top HIGH_SCORES_SHOWN high scores"""
         if not self.high_scores:
             print("\nNo scores recorded yet!")
             return
 
-        try:
-            # Ensure all entries have the correct format
-            valid_scores = []
-            for entry in self.high_scores:
-                if isinstance(entry, dict) and "score" in entry:
-                    valid_scores.append(entry)
-                elif isinstance(entry, (int, float)):  # Handle old format scores
-                    valid_scores.append({
-                        "player_name": "Unknown",
-                        "score": entry,
-                        "date": "Unknown"
-                    })
-
-            self.high_scores = valid_scores  # Update to valid scores only
-
+        if len(self.high_scores) > HIGH_SCORES_SHOWN:
+            print(f"\nHigh Scores (top {HIGH_SCORES_SHOWN} of {len(self.high_scores)}):")
+        else:
             print("\nHigh Scores:")
-            sorted_scores = sorted(
-                valid_scores,
-                key=lambda x: (x["score"], x.get("date", "")),
-                reverse=True
-            )
-
-            print("\n{:<20} {:<10} {:<20}".format("Player", "Score", "Date"))
-            print("="*50)
-            for score in sorted_scores:
-                print("{:<20} {:<10} {:<20}".format(
-                    score.get("player_name", "Unknown")[:20],
-                    score["score"],
-                    score.get("date", "Unknown")
-                ))
-
-            # Save the corrected format
-            self.save_high_scores()
-
-        except Exception as e:
-            print("\nError displaying high scores. Clearing corrupted scores.")
-            self.high_scores = []
-            self.save_high_scores()
+        sorted_scores = heapq.nlargest(
+            HIGH_SCORES_SHOWN,
+            self.high_scores,
+            key=lambda x: (x["score"], x.get("date", ""))
+        )
+
+        print("\n{:<20} {:<10} {:<20}".format("Player", "Score", "Date"))
+        print(_SEP50)
+        for score in sorted_scores:
+            print("{:<20} {:<10} {:<20}".format(
+                score.get("player_name", "Unknown")[:20],
+                score["score"],
+                score.get("date", "Unknown")
+            ))
 
     def save_high_scores(self):
-        """Save high scores to a file"""
+        """Rewrite the high scores file from self.high_scores"""
+        # Write a temp file and rename it over the original so a crash
+        # mid-write never leaves a truncated scores file behind
+        tmp = HIGH_SCORES_FILE + ".tmp"
         try:
-            with open("high_scores.json", "w") as f:
-                json.dump(self.high_scores, f)
+            with open(tmp, "wb") as f:
+                f.write(b"".join(_dumps(entry) + b"\n" for entry in self.high_scores))
+            os.replace(tmp, HIGH_SCORES_FILE)
+            self._dirty = False
         except Exception as e:
             print(f"\nError saving high scores: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:  # Never written, or cleanup failed; nothing more to do
+                pass
+
+    def _append_score(self, entry: Dict):
+        """Append a single score to the high scores file"""
+        try:
+            with open(HIGH_SCORES_FILE, "ab") as f:
+                f.write(_dumps(entry) + b"\n")
+        except Exception as e:
+            print(f"\nError appending high score: {e}. Rewriting the file instead.")
+            self.save_high_scores()
 
     def load_high_scores(self):
         """Load high scores from file"""
         try:
-            with open("high_scores.json", "r") as f:
-                self.high_scores = json.load(f)
+            st = os.stat(HIGH_SCORES_FILE)
+        except FileNotFoundError:
+            self._load_legacy_high_scores()
+            return
+
+        try:
+            key = (HIGH_SCORES_FILE, st.st_mtime_ns)
+            if key in _HS_CACHE:
+                self.high_scores = list(_HS_CACHE[key])
+                return
+
+            entries = []
+            skipped = 0
+            with open(HIGH_SCORES_FILE, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = _loads(line)
+                    except ValueError:  # JSONDecodeError, or bad UTF-8 under stdlib json
+                        skipped += 1
+                        continue
+                    # Share one string object per distinct player name
+                    if isinstance(entry, dict) and isinstance(entry.get("player_name"), str):
+                        entry["player_name"] = sys.intern(entry["player_name"])
+                    entries.append(entry)
+            self.high_scores = entries
+            self._normalize_high_scores()
+            _HS_CACHE.clear()
+            _HS_CACHE[key] = list(self.high_scores)
+
+            # Vacuum lines left unreadable by an interrupted append so later
+            # appends start on a clean line
+            if skipped:
+                print(f"\nSkipped {skipped} unreadable high score entries.")
+            if skipped or self._dirty:
+                self.save_high_scores()
+        except Exception as e:
+            print(f"\nError loading high scores: {e}")
+            self.high_scores = []
+
+    def _load_legacy_high_scores(self):
+        """Load and migrate scores saved as a single JSON array"""
+        try:
+            with open(LEGACY_HIGH_SCORES_FILE, "rb") as f:
+                self.high_scores = _loads(f.read())
         except FileNotFoundError:
             self.high_scores = []
+            return
         except json.JSONDecodeError:
             print("\nError loading high scores file. Starting with empty scores.")
             self.high_scores = []
+            return
         except Exception as e:
             print(f"\nError loading high scores: {e}")
             self.high_scores = []
+            return
+        if not isinstance(self.high_scores, list):
+            print("\nError loading high scores file. Starting with empty scores.")
+            self.high_scores = []
+            return
+        self._normalize_high_scores()
+        self.save_high_scores()
+
+    def _normalize_high_scores(self):
+        """Drop malformed entries and upgrade legacy or partial entries"""
+        # Common case: every entry is already current, nothing to rebuild
+        if all(_is_current_score(entry) for entry in self.high_scores):
+            return
+
+        valid_scores = []
+        for entry in self.high_scores:
+            if _is_current_score(entry):
+                valid_scores.append(entry)
+            elif isinstance(entry, dict) and isinstance(entry.get("score"), (int, float)):
+                # Fill in missing or non-text names and dates
+                name, date = entry.get("player_name"), entry.get("date")
+                valid_scores.append({
+                    **entry,
+                    "player_name": name if isinstance(name, str) else "Unknown",
+                    "date": date if isinstance(date, str) else "Unknown"
+                })
+            elif isinstance(entry, (int, float)):  # Handle old format scores
+                valid_scores.append({
+                    "player_name": "Unknown",
+                    "score": entry,
+                    "date": "Unknown"
+                })
+
+        if len(valid_scores) != len(self.high_scores) or any(
+            a is not b for a, b in zip(valid_scores, self.high_scores)
+        ):
+            self._dirty = True
+        self.high_scores = valid_scores
+
+def _is_current_score(entry) -> bool:
+    """Whether entry has a numeric score and text name/date show_high_scores can use"""
+    return (
+        type(entry) is dict
+        and isinstance(entry.get("score"), (int, float))
+        and isinstance(entry.get("player_name"), str)
+        and isinstance(entry.get("date"), str)
+    )
+
+def _stdin_is_file() -> bool:
+    """Whether stdin is redirected from a regular file, so reading it all can't block"""
+    try:
+        return stat.S_ISREG(os.fstat(sys.stdin.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+def _use_buffered_stdin():
+    """Serve input() from stdin read in one go, for scripted play from a file"""
+    lines = iter(sys.stdin.read().splitlines())
+
+    def buffered_input(prompt=""):
+        sys.stdout.write(prompt)
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError from None
+
+    builtins.input = buffered_input
 
 def main():
+    # Pipes and terminals may be interactive, so only files are read up front
+    if _stdin_is_file():
+        _use_buffered_stdin()
+
     game = AdventureGame()
 
     while True: